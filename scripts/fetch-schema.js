@@ -13,7 +13,7 @@
  *   --branch <branch>  The branch to fetch from (default: main)
  */
 
-import { createWriteStream, createReadStream, existsSync, mkdirSync, rmSync, readdirSync, cpSync } from 'fs'
+import { existsSync, mkdirSync, rmSync, readdirSync, cpSync } from 'fs'
 import { join, dirname } from 'path'
 import { fileURLToPath } from 'url'
 import { pipeline } from 'stream/promises'
@@ -48,9 +48,9 @@ function parseArgs() {
 }
 
 /**
- * Download file from URL
+ * Start downloading a URL and return the response body stream
  */
-async function downloadFile(url, destPath) {
+async function download(url) {
   const response = await fetch(url, {
     headers: {
       'User-Agent': 'boost-schema-validator'
@@ -62,14 +62,13 @@ async function downloadFile(url, destPath) {
     throw new Error(`Failed to download: ${response.status} ${response.statusText}`)
   }
 
-  const fileStream = createWriteStream(destPath)
-  await pipeline(response.body, fileStream)
+  return response.body
 }
 
 /**
- * Extract tarball and get schema directory
+ * Extract a gzipped tarball stream and get schema directory
  */
-async function extractSchema(tarballPath, branch) {
+async function extractSchema(archive) {
   const extractDir = join(TEMP_DIR, 'extracted')
 
   // Create extraction subdirectory
@@ -78,9 +77,9 @@ async function extractSchema(tarballPath, branch) {
   }
   mkdirSync(extractDir, { recursive: true })
 
-  // Extract the tarball
+  // Extract the tarball as it downloads, without saving it to disk first
   await pipeline(
-    createReadStream(tarballPath),
+    archive,
     createGunzip(),
     extract({
       cwd: extractDir,
@@ -126,7 +125,6 @@ function copyDirectory(src, dest) {
 async function main() {
   const { branch } = parseArgs()
   const tarballUrl = `https://github.com/${GITHUB_REPO}/archive/refs/heads/${branch}.tar.gz`
-  const tarballPath = join(TEMP_DIR, 'boost.tar.gz')
 
   console.log('🚀 Fetching BOOST schema from GitHub...\n')
   console.log(`   Repository: ${GITHUB_REPO}`)
@@ -141,14 +139,9 @@ async function main() {
     }
     mkdirSync(TEMP_DIR, { recursive: true })
 
-    // Download tarball
-    console.log('📥 Downloading repository archive...')
-    await downloadFile(tarballUrl, tarballPath)
-    console.log('   ✓ Download complete\n')
-
-    // Extract schema
-    console.log('📦 Extracting schema directory...')
-    const extractedSchemaPath = await extractSchema(tarballPath, branch)
+    // Download and extract schema
+    console.log('📥 Downloading and extracting repository archive...')
+    const extractedSchemaPath = await extractSchema(await download(tarballUrl))
     console.log('   ✓ Extraction complete\n')
 
     // Clear existing schema directory
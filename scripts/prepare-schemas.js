@@ -7,7 +7,8 @@
  * 1. Copying schemas from the BOOST repository
  * 2. Generating an index.json with entity list
  * 3. Converting dictionary .md files to .json format
- * 4. Organizing examples
+ * 4. Bundling each entity's examples into a single examples.json
+ * 5. Writing a gzipped copy of each output file for nginx's gzip_static
  */
 
 import {
@@ -16,13 +17,14 @@ import {
   readdirSync,
   readFileSync,
   writeFileSync,
-  copyFileSync,
-  statSync,
   rmSync
 } from 'fs'
 import { join, basename } from 'path'
 import { fileURLToPath } from 'url'
 import { dirname } from 'path'
+import { gzipSync, constants as zlibConstants } from 'zlib'
+import Ajv from 'ajv'
+import addFormats from 'ajv-formats'
 
 const __filename = fileURLToPath(import.meta.url)
 const __dirname = dirname(__filename)
@@ -33,6 +35,47 @@ const SCHEMA_SOURCE = join(__dirname, '../schema')
 // Output directory
 const OUTPUT_DIR = join(__dirname, '../public/schemas')
 
+// Dictionary markdown markers and patterns, compiled once
+const OVERVIEW_HEADING = '### Overview'
+const TABLE_OPEN = '<table class="data">'
+// Overview heading line, then everything up to the next ### line
+const OVERVIEW_RE = /(?:^|\n)[^\S\n]*### Overview[^\S\n]*(?=\n|$)([\s\S]*?)(?=\n###|$)/g
+// A data table runs until the next table tag
+const DATA_TABLE_RE = /<table class="data">([\s\S]*?)(?=<\/?table\b|$)/g
+const ROW_RE = /<tr\b[^>]*>([\s\S]*?)<\/tr>/g
+// <th> and <td> cells run up to the next tag
+const HEADER_RE = /<th\b[^>]*>([^<]*)/g
+const CELL_RE = /<td\b[^>]*>([^<]*)/g
+const BACKTICK_RE = /`/g
+const ENTITY_RE = /&(?:#(\d+)|#x([0-9a-f]+)|([a-z]+));/gi
+const MAX_CODE_POINT = 0x10ffff
+const NAMED_ENTITIES = new Map([
+  ['amp', '&'], ['lt', '<'], ['gt', '>'], ['quot', '"'], ['apos', "'"], ['nbsp', '\u00a0']
+])
+const REQUIRED_VALUES = ['yes', 'required', 'true']
+
+// Dictionary table columns, in the order used when a table has no headers
+const DICTIONARY_COLUMNS = ['field', 'type', 'required', 'description', 'examples']
+const REQUIRED_COLUMNS = DICTIONARY_COLUMNS.slice(0, 4)
+
+// Start of each snake_case word: underscores plus the letter that follows
+const SNAKE_WORD_RE = /(?:^|_)+([^_]?)/g
+const UNDERSCORE_RE = /_/g
+const WORD_START_RE = /\b\w/g
+
+// Display names for known example suffixes
+const EXAMPLE_NAMES = {
+  'example': 'Standard Example',
+  'carb_minimal': 'CARB Minimal (Required Fields Only)',
+  'afp_example': 'AFP Submission Example',
+  'marathon_q2_2025': 'Marathon Q2 2025'
+}
+
+// Validator matching the app's Ajv setup. Every schema is compiled here so a
+// broken schema fails the build and the app can skip meta-schema checks
+const ajv = new Ajv({ allErrors: true, strict: false })
+addFormats(ajv)
+
 /**
  * Verify the schema source directory exists
  */
@@ -47,14 +90,30 @@ function verifySchemaSource() {
   )
 }
 
+/**
+ * Read and parse a JSON file
+ */
+function readJson(filePath) {
+  return JSON.parse(readFileSync(filePath, 'utf-8'))
+}
+
+/**
+ * Write data as compact JSON - the output is only read by the app, so
+ * indentation would just add bytes to download and parse. A .gz copy
+ * compressed at the highest level goes alongside, so nginx can send it
+ * as-is instead of gzipping every response.
+ */
+function writeJson(filePath, data) {
+  const json = JSON.stringify(data)
+  writeFileSync(filePath, json)
+  writeFileSync(`${filePath}.gz`, gzipSync(json, { level: zlibConstants.Z_BEST_COMPRESSION }))
+}
+
 /**
  * Convert snake_case to PascalCase
  */
 function toPascalCase(str) {
-  return str
-    .split('_')
-    .map(word => word.charAt(0).toUpperCase() + word.slice(1))
-    .join('')
+  return str.replace(SNAKE_WORD_RE, (_match, initial) => initial.toUpperCase())
 }
 
 /**
@@ -65,78 +124,102 @@ function formatExampleName(filename, entityPrefix) {
   let name = filename.replace(`${entityPrefix}_`, '')
 
   // Special formatting for known suffixes
-  const nameMap = {
-    'example': 'Standard Example',
-    'carb_minimal': 'CARB Minimal (Required Fields Only)',
-    'afp_example': 'AFP Submission Example',
-    'marathon_q2_2025': 'Marathon Q2 2025'
+  return EXAMPLE_NAMES[name] || name.replace(UNDERSCORE_RE, ' ').replace(WORD_START_RE, c => c.toUpperCase())
+}
+
+/**
+ * Decode the character references in cell text (e.g. array&lt;string&gt;)
+ */
+function decodeEntities(text) {
+  return text.replace(ENTITY_RE, (entity, decimal, hex, name) => {
+    if (decimal || hex) {
+      // Leave NUL, lone surrogates and out-of-range code points as written
+      const codePoint = decimal ? Number(decimal) : parseInt(hex, 16)
+      const decodable = codePoint > 0 && codePoint <= MAX_CODE_POINT &&
+        (codePoint < 0xd800 || codePoint > 0xdfff)
+      return decodable ? String.fromCodePoint(codePoint) : entity
+    }
+    return NAMED_ENTITIES.get(name.toLowerCase()) ?? entity
+  })
+}
+
+/**
+ * Clean up raw cell text. Most cells are plain text, so the backtick and
+ * entity passes only run when the cell contains one.
+ */
+function cellText(raw) {
+  let text = raw.trim()
+  if (text.includes('`')) {
+    // Remove markdown backticks
+    text = text.replace(BACKTICK_RE, '')
   }
+  return text.includes('&') ? decodeEntities(text) : text
+}
 
-  return nameMap[name] || name.replace(/_/g, ' ').replace(/\b\w/g, c => c.toUpperCase())
+/**
+ * Return the rows of the <table class="data"> blocks, each as an object
+ * mapping lowercased column header to cell text
+ */
+function parseDataTableRows(content) {
+  const rows = []
+
+  for (const [, table] of content.matchAll(DATA_TABLE_RE)) {
+    const headers = Array.from(table.matchAll(HEADER_RE), ([, text]) => text.trim().toLowerCase())
+    const columns = headers.length > 0 ? headers : DICTIONARY_COLUMNS
+
+    for (const [, row] of table.matchAll(ROW_RE)) {
+      const cells = {}
+      let column = 0
+      for (const [, text] of row.matchAll(CELL_RE)) {
+        // Every cell takes its header's column, even one with no text
+        // before its first tag, which is left out
+        if (text) {
+          cells[columns[column]] = cellText(text)
+        }
+        column++
+      }
+      rows.push(cells)
+    }
+  }
+
+  return rows
 }
 
 /**
  * Parse dictionary markdown into JSON
  */
 function parseDictionaryMarkdown(content) {
-  const lines = content.split('\n')
-  let overview = ''
-  let inOverview = false
+  const overviewLines = []
   const fields = {}
-  let inTable = false
-
-  for (let i = 0; i < lines.length; i++) {
-    const line = lines[i]
-
-    // Extract overview section
-    if (line.trim() === '### Overview') {
-      inOverview = true
-      continue
-    } else if (line.startsWith('###') && inOverview) {
-      inOverview = false
-    } else if (inOverview && line.trim()) {
-      overview += line.trim() + ' '
-    }
-
-    // Parse field table
-    if (line.includes('<table class="data">')) {
-      inTable = true
-      continue
-    } else if (line.includes('</table>')) {
-      inTable = false
-      continue
-    }
 
-    if (inTable && line.trim().startsWith('<tr>')) {
-      // Parse table row
-      const fieldData = []
-      let j = i + 1
-      while (j < lines.length && !lines[j].trim().startsWith('</tr>')) {
-        const cellMatch = lines[j].match(/<td>([^<]+)/)
-        if (cellMatch) {
-          let cellContent = cellMatch[1].trim()
-          // Remove markdown backticks
-          cellContent = cellContent.replace(/`/g, '')
-          fieldData.push(cellContent)
+  // Extract overview section text, one line at a time
+  if (content.includes(OVERVIEW_HEADING)) {
+    for (const [, section] of content.matchAll(OVERVIEW_RE)) {
+      for (const line of section.split('\n')) {
+        const text = line.trim()
+        if (text && text !== OVERVIEW_HEADING) {
+          overviewLines.push(text)
         }
-        j++
       }
+    }
+  }
 
-      // Store field information if we have enough data
-      if (fieldData.length >= 4) {
-        const fieldName = fieldData[0]
-        fields[fieldName] = {
-          type: fieldData[1],
-          required: ['yes', 'required', 'true'].includes(fieldData[2].toLowerCase()),
-          description: fieldData[3],
-          examples: fieldData[4] || ''
-        }
+  // Parse field table (some dictionaries have none)
+  const rows = content.includes(TABLE_OPEN) ? parseDataTableRows(content) : []
+  for (const fieldData of rows) {
+    // Store field information if we have enough data
+    if (REQUIRED_COLUMNS.every(column => column in fieldData)) {
+      fields[fieldData.field] = {
+        type: fieldData.type,
+        required: REQUIRED_VALUES.includes(fieldData.required.toLowerCase()),
+        description: fieldData.description,
+        examples: fieldData.examples || ''
       }
     }
   }
 
   return {
-    overview: overview.trim(),
+    overview: overviewLines.join(' '),
     fields
   }
 }
@@ -147,53 +230,52 @@ function parseDictionaryMarkdown(content) {
 function processEntity(sourceDir, entityDir, outputDir) {
   const entityPath = join(sourceDir, entityDir)
   const entityOutputPath = join(outputDir, entityDir)
-  const examplesOutputPath = join(entityOutputPath, 'examples')
 
-  // Create output directories
+  // Create output directory
   mkdirSync(entityOutputPath, { recursive: true })
-  mkdirSync(examplesOutputPath, { recursive: true })
 
-  const files = readdirSync(entityPath)
+  // Dirent types come with the listing, so no file needs a stat call
+  const entries = readdirSync(entityPath, { withFileTypes: true })
   const examples = []
 
-  for (const file of files) {
-    const filePath = join(entityPath, file)
-    const stat = statSync(filePath)
+  for (const entry of entries) {
+    if (!entry.isFile()) continue
 
-    if (!stat.isFile()) continue
+    const file = entry.name
+    const filePath = join(entityPath, file)
 
     if (file === 'validation_schema.json') {
-      // Copy schema file
-      copyFileSync(filePath, join(entityOutputPath, file))
+      // Check the schema compiles, then copy it
+      const fullSchema = readJson(filePath)
+      try {
+        ajv.compile(fullSchema.schema || fullSchema)
+      } catch (e) {
+        throw new Error(`Invalid schema for ${entityDir}: ${e.message}`)
+      }
+      writeJson(join(entityOutputPath, file), fullSchema)
     } else if (file.endsWith('_dictionary.md')) {
       // Convert dictionary to JSON
       try {
         const content = readFileSync(filePath, 'utf-8')
         const dictionary = parseDictionaryMarkdown(content)
-        writeFileSync(
-          join(entityOutputPath, 'dictionary.json'),
-          JSON.stringify(dictionary, null, 2)
-        )
+        writeJson(join(entityOutputPath, 'dictionary.json'), dictionary)
       } catch (e) {
         console.warn(`  ⚠️  Could not parse dictionary: ${file}`)
       }
     } else if (file.endsWith('.json') && file !== 'validation_schema.json') {
-      // Copy example file
+      // Collect example for the bundle
       const exampleName = basename(file, '.json')
-      copyFileSync(filePath, join(examplesOutputPath, file))
       examples.push({
         name: formatExampleName(exampleName, entityDir),
-        filename: exampleName
+        filename: exampleName,
+        data: readJson(filePath)
       })
     }
   }
 
-  // Write examples index
+  // Write all examples as one file so the app loads them with a single request
   if (examples.length > 0) {
-    writeFileSync(
-      join(examplesOutputPath, 'index.json'),
-      JSON.stringify(examples, null, 2)
-    )
+    writeJson(join(entityOutputPath, 'examples.json'), examples)
   }
 
   return toPascalCase(entityDir)
@@ -215,32 +297,30 @@ function main() {
   }
   mkdirSync(OUTPUT_DIR, { recursive: true })
 
-  // Get all entity directories
-  const items = readdirSync(sourceDir)
+  // Get all entity directories (dirent types come with the listing, so only
+  // the schema file check needs a stat call)
+  const items = readdirSync(sourceDir, { withFileTypes: true })
   const entities = []
+  const directories = {}
 
   for (const item of items) {
-    const itemPath = join(sourceDir, item)
-    const stat = statSync(itemPath)
-
-    if (stat.isDirectory()) {
-      // Check if it has a validation_schema.json
-      if (existsSync(join(itemPath, 'validation_schema.json'))) {
-        console.log(`📋 Processing: ${item}`)
-        const entityName = processEntity(sourceDir, item, OUTPUT_DIR)
-        entities.push(entityName)
-      }
+    if (!item.isDirectory()) continue
+
+    // Check if it has a validation_schema.json
+    if (existsSync(join(sourceDir, item.name, 'validation_schema.json'))) {
+      console.log(`📋 Processing: ${item.name}`)
+      const entityName = processEntity(sourceDir, item.name, OUTPUT_DIR)
+      entities.push(entityName)
+      directories[entityName] = item.name
     }
   }
 
   // Sort entities alphabetically
   entities.sort()
 
-  // Write entity index
-  writeFileSync(
-    join(OUTPUT_DIR, 'index.json'),
-    JSON.stringify({ entities }, null, 2)
-  )
+  // Write entity index, including the entity -> directory mapping so the
+  // app doesn't have to derive directory names at runtime
+  writeJson(join(OUTPUT_DIR, 'index.json'), { entities, directories })
 
   console.log(`\n✅ Prepared ${entities.length} entities`)
   console.log(`📁 Output directory: ${OUTPUT_DIR}`)
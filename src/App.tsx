@@ -1,16 +1,18 @@
-import { useState, useEffect } from 'react'
+import { useState, useEffect, useRef, lazy, Suspense } from 'react'
 import Header from './components/layout/Header'
 import Footer from './components/layout/Footer'
 import EntitySelector from './components/EntitySelector'
 import JsonEditor from './components/JsonEditor'
 import ValidationResults from './components/ValidationResults'
 import EntityRepresentation from './components/EntityRepresentation'
-import DataGapAnalysis from './components/DataGapAnalysis'
-import BioramDataGapAnalysis from './components/BioramDataGapAnalysis'
 import FieldTable from './components/FieldTable'
 import { getEntityList, loadEntitySchema, loadEntityDictionary } from './services/schemaLoader'
 import { ValidationResult, EntitySchema, EntityDictionary } from './types'
 
+// Gap analyses only apply to LCFS/BioRAM entities, so load them on demand
+const DataGapAnalysis = lazy(() => import('./components/DataGapAnalysis'))
+const BioramDataGapAnalysis = lazy(() => import('./components/BioramDataGapAnalysis'))
+
 function App() {
   const [entities, setEntities] = useState<string[]>([])
   const [currentEntity, setCurrentEntity] = useState<string>('')
@@ -20,6 +22,8 @@ function App() {
   const [isValidating, setIsValidating] = useState(false)
   const [currentSchema, setCurrentSchema] = useState<EntitySchema | null>(null)
   const [currentDictionary, setCurrentDictionary] = useState<EntityDictionary | null>(null)
+  // Entity and JSON text behind the current validation result
+  const lastValidated = useRef<{ entity: string; json: string } | null>(null)
 
   // Load entities on mount
   useEffect(() => {
@@ -34,6 +38,16 @@ function App() {
     loadEntities()
   }, [])
 
+  // Compile the validator (and the worker's, once one is running) as soon as
+  // an entity is selected
+  useEffect(() => {
+    if (!currentEntity) return
+
+    import('./services/workerValidator')
+      .then(({ precompileEntityValidators }) => precompileEntityValidators(currentEntity))
+      .catch(error => console.error('Failed to precompile validator:', error))
+  }, [currentEntity])
+
   // Check if current entity is an LCFS entity (for gap analysis)
   const isLcfsEntity = currentEntity.toLowerCase().includes('lcfs')
 
@@ -43,24 +57,34 @@ function App() {
   const handleValidate = async () => {
     if (!currentEntity || !jsonData) return
 
+    // Nothing has changed since the last run, so the result still stands
+    if (validationResult && lastValidated.current?.entity === currentEntity &&
+        lastValidated.current.json === jsonData) {
+      return
+    }
+
+    // Whatever this run ends with replaces the result the ref describes
+    lastValidated.current = null
     setIsValidating(true)
     try {
       // Parse JSON first
       const parsed = JSON.parse(jsonData)
       setParsedData(parsed)
 
-      // Load schema and dictionary in parallel
-      const [fullSchema, dictionary] = await Promise.all([
+      // Load schema, dictionary and validator in parallel. The validator is
+      // imported dynamically to keep the initial bundle small, and reuses the
+      // schema loaded here from the loader's cache.
+      const [fullSchema, dictionary, { validateEntityData }] = await Promise.all([
         loadEntitySchema(currentEntity),
-        loadEntityDictionary(currentEntity)
+        loadEntityDictionary(currentEntity),
+        import('./services/workerValidator')
       ])
       setCurrentSchema(fullSchema.schema)
       setCurrentDictionary(dictionary)
 
-      // Import validator dynamically to keep initial bundle small
-      const { validateEntity } = await import('./services/validator')
-      const result = await validateEntity(currentEntity, parsed)
+      const result = await validateEntityData(currentEntity, parsed, jsonData.length)
       setValidationResult(result)
+      lastValidated.current = { entity: currentEntity, json: jsonData }
     } catch (error) {
       if (error instanceof SyntaxError) {
         setValidationResult({
@@ -164,28 +188,32 @@ function App() {
 
         {/* Gap Analysis for LCFS entities */}
         {validationResult && parsedData && isLcfsEntity && (
-          <DataGapAnalysis
-            entityName={currentEntity}
-            data={parsedData}
-            validationResult={validationResult}
-            schema={currentSchema ? {
-              required: currentSchema.required,
-              properties: currentSchema.properties as Record<string, unknown>
-            } : undefined}
-          />
+          <Suspense fallback={null}>
+            <DataGapAnalysis
+              entityName={currentEntity}
+              data={parsedData}
+              validationResult={validationResult}
+              schema={currentSchema ? {
+                required: currentSchema.required,
+                properties: currentSchema.properties as Record<string, unknown>
+              } : undefined}
+            />
+          </Suspense>
         )}
 
         {/* Gap Analysis for BioRAM entities */}
         {validationResult && parsedData && isBioramEntity && (
-          <BioramDataGapAnalysis
-            entityName={currentEntity}
-            data={parsedData}
-            validationResult={validationResult}
-            schema={currentSchema ? {
-              required: currentSchema.required,
-              properties: currentSchema.properties as Record<string, unknown>
-            } : undefined}
-          />
+          <Suspense fallback={null}>
+            <BioramDataGapAnalysis
+              entityName={currentEntity}
+              data={parsedData}
+              validationResult={validationResult}
+              schema={currentSchema ? {
+                required: currentSchema.required,
+                properties: currentSchema.properties as Record<string, unknown>
+              } : undefined}
+            />
+          </Suspense>
         )}
       </main>
 
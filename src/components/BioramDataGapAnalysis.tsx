@@ -9,6 +9,7 @@
  */
 import { ValidationResult } from '../types'
 import { escapeHtml } from '../utils/fieldFormatting'
+import { indexByLowerCaseKey } from '../utils/entityNames'
 import {
   BioramEntityConfig,
   findBioramEntityConfig
@@ -296,6 +297,8 @@ const bioramFieldMetadata: Record<string, Record<string, FieldMetadata>> = {
   }
 }
 
+const bioramFieldMetadataByLowerKey = indexByLowerCaseKey(bioramFieldMetadata)
+
 interface FieldStatus {
   field: string
   value?: unknown
@@ -357,10 +360,8 @@ export default function BioramDataGapAnalysis({
 
   // Get field metadata for this entity type
   const normalizedType = currentEntityType.replace(/[-_]/g, '').toLowerCase()
-  const metadataKey = Object.keys(bioramFieldMetadata).find(
-    k => k.toLowerCase() === normalizedType
-  ) || currentEntityType
-  const fieldMetadata = bioramFieldMetadata[metadataKey] || {}
+  const fieldMetadata = bioramFieldMetadataByLowerKey.get(normalizedType) ||
+    bioramFieldMetadata[currentEntityType] || {}
 
   // Analyze the data
   const analysis = analyzeBioramGaps(data, config, fieldMetadata)
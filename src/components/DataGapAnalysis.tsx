@@ -223,6 +223,11 @@ function analyzeDataGaps(
   const allFields = Object.keys(schemaProperties)
   const schemaRequired = schema?.required || []
 
+  // Build the membership lookups once instead of scanning the arrays per field
+  const requiredFields = new Set(schemaRequired)
+  const carbFields = new Set(config.carbRequiredFields)
+  const providedFields = new Set<string>()
+
   allFields.forEach(field => {
     // Skip only @context
     if (field === '@context') return
@@ -232,16 +237,17 @@ function analyzeDataGaps(
                      jsonData[field] !== undefined
 
     if (hasValue) {
+      providedFields.add(field)
       provided.push({
         field,
         value: jsonData[field],
-        inCARB: config.carbRequiredFields.includes(field),
-        required: schemaRequired.includes(field)
+        inCARB: carbFields.has(field),
+        required: requiredFields.has(field)
       })
     } else {
       missing.push({
         field,
-        required: schemaRequired.includes(field),
+        required: requiredFields.has(field),
         complexity: getFieldComplexity(field, config),
         metadata: config.fieldMetadata[field]
       })
@@ -250,7 +256,7 @@ function analyzeDataGaps(
 
   // Calculate missing CARB and BOOST required fields
   const missingCarbRequired = config.carbRequiredFields.filter(
-    carbField => !provided.find(p => p.field === carbField)
+    carbField => !providedFields.has(carbField)
   )
 
   const missingBoostRequired = missing.filter(f => f.required)
@@ -2,6 +2,19 @@ import { useState, useEffect } from 'react'
 import { loadEntityExamples, loadEntitySchema } from '../services/schemaLoader'
 import { EntityExample } from '../types'
 
+// Pretty-printed JSON for schemas and examples. The loader caches those
+// objects, so each one only needs formatting once.
+const formattedJsonCache = new WeakMap<object, string>()
+
+function formatJson(value: object): string {
+  let text = formattedJsonCache.get(value)
+  if (text === undefined) {
+    text = JSON.stringify(value, null, 2)
+    formattedJsonCache.set(value, text)
+  }
+  return text
+}
+
 interface EntitySelectorProps {
   entities: string[]
   currentEntity: string
@@ -42,7 +55,7 @@ export default function EntitySelector({
   }
 
   const handleExampleLoad = (example: EntityExample) => {
-    onJsonLoad(JSON.stringify(example.data, null, 2))
+    onJsonLoad(formatJson(example.data))
   }
 
   const handleViewSchema = async () => {
@@ -50,7 +63,7 @@ export default function EntitySelector({
 
     try {
       const fullSchema = await loadEntitySchema(currentEntity)
-      setSchemaContent(JSON.stringify(fullSchema.schema || fullSchema, null, 2))
+      setSchemaContent(formatJson(fullSchema.schema || fullSchema))
       setShowSchemaModal(true)
     } catch (error) {
       console.error('Failed to load schema:', error)
@@ -146,6 +146,8 @@ function BasicTable({
   errorMap: Record<string, string[]>
   requiredFields: string[]
 }) {
+  const required = new Set(requiredFields)
+
   return (
     <div className="overflow-x-auto rounded-lg border border-base-300 shadow-sm">
       <table className="table table-zebra table-sm">
@@ -165,7 +167,7 @@ function BasicTable({
               field={field}
               hasError={!!(errorMap[field.path]?.length)}
               errors={errorMap[field.path] || []}
-              isRequired={requiredFields.includes(field.name)}
+              isRequired={required.has(field.name)}
             />
           ))}
         </tbody>
@@ -2,6 +2,7 @@ import { useState } from 'react'
 import { ValidationResult, ValidationError } from '../../types'
 import { isLcfsEntity, calculateLcfsCompliance, findLcfsEntityConfig } from '../../utils/lcfsEntityConfig'
 import { isBioramEntity, calculateBioramRealityCompliance, getBoostOnlyFieldsStatus, findBioramEntityConfig } from '../../utils/bioramEntityConfig'
+import { MAX_REPORTED_ERRORS, formatErrorCount } from '../../utils/errorMapping'
 
 interface SummaryViewProps {
   result: ValidationResult | null
@@ -89,6 +90,7 @@ function LcfsSplitValidationView({
   const lcfsCompliance = calculateLcfsCompliance(entityName, parsedData)
   const config = findLcfsEntityConfig(entityName)
   const carbRequiredFields = config?.carbRequiredFields || []
+  const carbRequiredSet = new Set(carbRequiredFields)
 
   // Separate errors into LCFS errors (missing CARB required fields) and BOOST-only errors
   const lcfsErrors: ValidationError[] = []
@@ -99,7 +101,7 @@ function LcfsSplitValidationView({
     const fieldMatch = error.message.match(/Missing required field: '([^']+)'/)
     if (fieldMatch) {
       const fieldName = fieldMatch[1]
-      if (carbRequiredFields.includes(fieldName)) {
+      if (carbRequiredSet.has(fieldName)) {
         lcfsErrors.push(error)
       } else {
         boostErrors.push(error)
@@ -199,7 +201,7 @@ function LcfsSplitValidationView({
               </svg>
               <div>
                 <h3 className="font-bold">BOOST Gaps Found</h3>
-                <p className="text-sm">{boostErrors.length} additional field{boostErrors.length !== 1 ? 's' : ''} needed for full BOOST compliance</p>
+                <p className="text-sm">{formatErrorCount(boostErrors.length, result.truncated, 'additional field')} needed for full BOOST compliance</p>
               </div>
             </div>
           )}
@@ -346,7 +348,7 @@ function BioramSplitValidationView({
               </svg>
               <div>
                 <h3 className="font-bold">BOOST Gaps Found</h3>
-                <p className="text-sm">{result.errors.length} additional field{result.errors.length !== 1 ? 's' : ''} needed for full BOOST compliance</p>
+                <p className="text-sm">{formatErrorCount(result.errors.length, result.truncated, 'additional field')} needed for full BOOST compliance</p>
               </div>
             </div>
           )}
@@ -424,7 +426,11 @@ function SingleValidationView({ result }: { result: ValidationResult }) {
         </svg>
         <div>
           <h3 className="font-bold">Validation Failed</h3>
-          <p>{result.errors.length} error{result.errors.length !== 1 ? 's' : ''} found</p>
+          <p>
+            {result.truncated
+              ? `Too many errors to list, showing the first ${MAX_REPORTED_ERRORS} reported`
+              : `${formatErrorCount(result.errors.length, false, 'error')} found`}
+          </p>
         </div>
       </div>
 
@@ -435,7 +441,7 @@ function SingleValidationView({ result }: { result: ValidationResult }) {
             className={`tab ${activeTab === 'all' ? 'tab-active' : ''}`}
             onClick={() => setActiveTab('all')}
           >
-            All ({result.errors.length})
+            All ({formatErrorCount(result.errors.length, result.truncated)})
           </button>
           {errorTypes.map(([type, errors]) => (
             <button
@@ -443,7 +449,7 @@ function SingleValidationView({ result }: { result: ValidationResult }) {
               className={`tab ${activeTab === type ? 'tab-active' : ''}`}
               onClick={() => setActiveTab(type)}
             >
-              {ERROR_TYPE_LABELS[type] || type} ({errors.length})
+              {ERROR_TYPE_LABELS[type] || type} ({formatErrorCount(errors.length, result.truncated)})
             </button>
           ))}
         </div>
@@ -1,6 +1,7 @@
 import { ValidationResult } from '../../types'
 import { isLcfsEntity, calculateLcfsCompliance } from '../../utils/lcfsEntityConfig'
 import { isBioramEntity, calculateBioramRealityCompliance, getBoostOnlyFieldsStatus } from '../../utils/bioramEntityConfig'
+import { formatErrorCount } from '../../utils/errorMapping'
 import SummaryView from './SummaryView'
 
 interface ValidationResultsProps {
@@ -84,7 +85,7 @@ function StatusBadge({ result, isValidating }: { result: ValidationResult | null
 
   return (
     <div className="badge badge-lg badge-error flex-shrink-0">
-      {result.errors.length} Error{result.errors.length !== 1 ? 's' : ''}
+      {formatErrorCount(result.errors.length, result.truncated, 'Error')}
     </div>
   )
 }
@@ -158,7 +159,7 @@ function DualStatusBadge({ result, isValidating, entityName, parsedData }: DualS
             <svg className="w-3 h-3" fill="currentColor" viewBox="0 0 20 20">
               <path fillRule="evenodd" d="M8.257 3.099c.765-1.36 2.722-1.36 3.486 0l5.58 9.92c.75 1.334-.213 2.98-1.742 2.98H4.42c-1.53 0-2.493-1.646-1.743-2.98l5.58-9.92zM11 13a1 1 0 11-2 0 1 1 0 012 0zm-1-8a1 1 0 00-1 1v3a1 1 0 002 0V6a1 1 0 00-1-1z" clipRule="evenodd"/>
             </svg>
-            {result.errors.length} Gap{result.errors.length !== 1 ? 's' : ''}
+            {formatErrorCount(result.errors.length, result.truncated, 'Gap')}
           </div>
         )}
       </div>
@@ -232,7 +233,7 @@ function BioramDualStatusBadge({ result, isValidating, entityName, parsedData }:
             <svg className="w-3 h-3" fill="currentColor" viewBox="0 0 20 20">
               <path fillRule="evenodd" d="M8.257 3.099c.765-1.36 2.722-1.36 3.486 0l5.58 9.92c.75 1.334-.213 2.98-1.742 2.98H4.42c-1.53 0-2.493-1.646-1.743-2.98l5.58-9.92zM11 13a1 1 0 11-2 0 1 1 0 012 0zm-1-8a1 1 0 00-1 1v3a1 1 0 002 0V6a1 1 0 00-1-1z" clipRule="evenodd"/>
             </svg>
-            {result.errors.length} Gap{result.errors.length !== 1 ? 's' : ''}
+            {formatErrorCount(result.errors.length, result.truncated, 'Gap')}
           </div>
         )}
       </div>
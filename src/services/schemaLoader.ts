@@ -7,15 +7,35 @@ const schemaCache = new Map<string, FullSchema>()
 const examplesCache = new Map<string, EntityExample[]>()
 const dictionaryCache = new Map<string, EntityDictionary>()
 let entityListCache: string[] | null = null
+let entityDirCache: Record<string, string> = {}
+const entityUrlCache = new Map<string, string>()
+
+// Requests in flight, so concurrent callers (e.g. the validator warm-up and
+// the Validate button) share a single fetch instead of racing the cache
+const pendingRequests = new Map<string, Promise<unknown>>()
+
+// Position before each capital letter except the first character
+const WORD_BOUNDARY_RE = /(?!^)(?=[A-Z])/g
 
 /**
  * Convert PascalCase entity name to snake_case directory name
  */
 function toSnakeCase(entityName: string): string {
-  return entityName
-    .replace(/([A-Z])/g, (_match, p1, offset) =>
-      offset > 0 ? '_' + p1.toLowerCase() : p1.toLowerCase()
-    )
+  return entityName.replace(WORD_BOUNDARY_RE, '_').toLowerCase()
+}
+
+/**
+ * Run a load once per key while it is in flight
+ */
+function shareRequest<T>(key: string, load: () => Promise<T>): Promise<T> {
+  const pending = pendingRequests.get(key)
+  if (pending) {
+    return pending as Promise<T>
+  }
+
+  const request = load().finally(() => pendingRequests.delete(key))
+  pendingRequests.set(key, request)
+  return request
 }
 
 /**
@@ -26,6 +46,10 @@ export async function getEntityList(): Promise<string[]> {
     return entityListCache
   }
 
+  return shareRequest('index', fetchEntityList)
+}
+
+async function fetchEntityList(): Promise<string[]> {
   const response = await fetch(`${BASE_URL}schemas/index.json`)
   if (!response.ok) {
     throw new Error('Failed to load entity list')
@@ -33,9 +57,32 @@ export async function getEntityList(): Promise<string[]> {
 
   const data = await response.json()
   entityListCache = data.entities
+  entityDirCache = data.directories || {}
   return entityListCache!
 }
 
+/**
+ * Get the base URL of an entity's schema directory. The directory comes from
+ * the entity index, falling back to deriving it from the entity name.
+ */
+async function getEntityUrl(entityName: string): Promise<string> {
+  const cached = entityUrlCache.get(entityName)
+  if (cached) {
+    return cached
+  }
+
+  try {
+    await getEntityList()
+  } catch {
+    // Index unavailable - derive the directory name instead
+  }
+
+  const dirName = entityDirCache[entityName] || toSnakeCase(entityName)
+  const url = `${BASE_URL}schemas/${dirName}/`
+  entityUrlCache.set(entityName, url)
+  return url
+}
+
 /**
  * Load schema for a specific entity
  */
@@ -45,8 +92,12 @@ export async function loadEntitySchema(entityName: string): Promise<FullSchema>
     return cached
   }
 
-  const dirName = toSnakeCase(entityName)
-  const response = await fetch(`${BASE_URL}schemas/${dirName}/validation_schema.json`)
+  return shareRequest(`schema:${entityName}`, () => fetchEntitySchema(entityName))
+}
+
+async function fetchEntitySchema(entityName: string): Promise<FullSchema> {
+  const entityUrl = await getEntityUrl(entityName)
+  const response = await fetch(`${entityUrl}validation_schema.json`)
 
   if (!response.ok) {
     throw new Error(`Failed to load schema for ${entityName}`)
@@ -66,31 +117,23 @@ export async function loadEntityExamples(entityName: string): Promise<EntityExam
     return cached
   }
 
-  const dirName = toSnakeCase(entityName)
+  return shareRequest(`examples:${entityName}`, () => fetchEntityExamples(entityName))
+}
+
+async function fetchEntityExamples(entityName: string): Promise<EntityExample[]> {
+  const entityUrl = await getEntityUrl(entityName)
 
   try {
-    // Load the examples index for this entity
-    const response = await fetch(`${BASE_URL}schemas/${dirName}/examples/index.json`)
+    // Examples are bundled per entity at build time
+    const response = await fetch(`${entityUrl}examples.json`)
 
     if (!response.ok) {
-      // No examples available
+      // No examples available - remember that so later lookups skip the request
+      examplesCache.set(entityName, [])
       return []
     }
 
-    const examplesList: { name: string; filename: string }[] = await response.json()
-
-    // Load each example
-    const examples: EntityExample[] = await Promise.all(
-      examplesList.map(async (ex) => {
-        const exResponse = await fetch(`${BASE_URL}schemas/${dirName}/examples/${ex.filename}.json`)
-        const data = await exResponse.json()
-        return {
-          name: ex.name,
-          filename: ex.filename,
-          data
-        }
-      })
-    )
+    const examples: EntityExample[] = await response.json()
 
     examplesCache.set(entityName, examples)
     return examples
@@ -108,13 +151,20 @@ export async function loadEntityDictionary(entityName: string): Promise<EntityDi
     return cached
   }
 
-  const dirName = toSnakeCase(entityName)
+  return shareRequest(`dictionary:${entityName}`, () => fetchEntityDictionary(entityName))
+}
+
+async function fetchEntityDictionary(entityName: string): Promise<EntityDictionary> {
+  const entityUrl = await getEntityUrl(entityName)
 
   try {
-    const response = await fetch(`${BASE_URL}schemas/${dirName}/dictionary.json`)
+    const response = await fetch(`${entityUrl}dictionary.json`)
 
     if (!response.ok) {
-      return { overview: '', fields: {}, error: 'Dictionary not found' }
+      // Missing dictionaries don't appear until the next build, so cache the miss
+      const missing: EntityDictionary = { overview: '', fields: {}, error: 'Dictionary not found' }
+      dictionaryCache.set(entityName, missing)
+      return missing
     }
 
     const dictionary = await response.json()
@@ -133,4 +183,6 @@ export function clearSchemaCache(): void {
   examplesCache.clear()
   dictionaryCache.clear()
   entityListCache = null
+  entityDirCache = {}
+  entityUrlCache.clear()
 }
@@ -1,24 +1,68 @@
-import Ajv, { ErrorObject } from 'ajv'
+import Ajv, { ErrorObject, ValidateFunction } from 'ajv'
 import addFormats from 'ajv-formats'
-import { ValidationResult, ValidationError } from '../types'
+import { ValidationResult, ValidationError, FullSchema } from '../types'
 import { loadEntitySchema } from './schemaLoader'
+import { MAX_REPORTED_ERRORS } from '../utils/errorMapping'
 
-// Initialize Ajv with all errors mode
+// Initialize Ajv with all errors mode. Schemas are compiled against the
+// meta-schema by prepare-schemas at build time, so skip that check here.
+// Ajv generates a JavaScript validation function for each schema. Generating
+// it is the expensive step and only needs doing once per schema, hence the
+// validator cache below.
 const ajv = new Ajv({
   allErrors: true,
-  verbose: true,
-  strict: false
+  strict: false,
+  validateSchema: false
 })
 
 // Add format validators (date, uri, email, etc.)
 addFormats(ajv)
 
+// Compiled validators keyed by the loaded schema document. The schema loader
+// caches and shares loads, so this compiles once per schema, and a schema
+// reloaded after clearSchemaCache() gets a fresh validator.
+const validatorCache = new WeakMap<FullSchema, ValidateFunction>()
+
+// Result for data that passes validation. It never varies, so it is built
+// once and the valid path returns without allocating anything. Every valid
+// result shares its errors containers, so those are frozen as well.
+const VALID_RESULT: ValidationResult = Object.freeze({
+  valid: true,
+  schema_valid: true,
+  business_rules_valid: true,
+  errors: Object.freeze<ValidationError[]>([]) as ValidationError[],
+  errors_by_type: Object.freeze({}) as Record<string, ValidationError[]>,
+  message: 'Validation successful'
+})
+
+// JSON Pointer escapes, and the separators turned into dotted field paths
+const POINTER_SLASH_RE = /~1/g
+const POINTER_TILDE_RE = /~0/g
+const LEADING_SLASH_RE = /^\//
+const SLASH_RE = /\//g
+
+/**
+ * Resolve the value at a JSON Pointer instance path. Ajv's verbose mode would
+ * attach this (plus both schemas) to every error object; looking it up only
+ * for the errors we report keeps the errors lean.
+ */
+function getInstanceValue(data: unknown, instancePath: string): unknown {
+  let value = data
+  for (const segment of instancePath.split('/').slice(1)) {
+    if (value === null || typeof value !== 'object') {
+      return undefined
+    }
+    value = (value as Record<string, unknown>)[segment.replace(POINTER_SLASH_RE, '/').replace(POINTER_TILDE_RE, '~')]
+  }
+  return value
+}
+
 /**
  * Convert Ajv error to our ValidationError format
  */
-function formatAjvError(error: ErrorObject): ValidationError {
+function formatAjvError(error: ErrorObject, data: unknown): ValidationError {
   const fieldPath = error.instancePath
-    ? error.instancePath.replace(/^\//, '').replace(/\//g, '.')
+    ? error.instancePath.replace(LEADING_SLASH_RE, '').replace(SLASH_RE, '.')
     : 'root'
 
   switch (error.keyword) {
@@ -49,7 +93,7 @@ function formatAjvError(error: ErrorObject): ValidationError {
         field: fieldPath,
         message: `Field '${fieldPath}': expected type ${expectedType}`,
         expected: expectedType,
-        actual_value: error.data
+        actual_value: getInstanceValue(data, error.instancePath)
       }
     }
 
@@ -60,7 +104,7 @@ function formatAjvError(error: ErrorObject): ValidationError {
         field: fieldPath,
         message: `Field '${fieldPath}': value must be one of: ${allowedValues.map(v => `'${v}'`).join(', ')}`,
         allowed_values: allowedValues,
-        actual_value: error.data
+        actual_value: getInstanceValue(data, error.instancePath)
       }
     }
 
@@ -71,7 +115,7 @@ function formatAjvError(error: ErrorObject): ValidationError {
         field: fieldPath,
         message: `Field '${fieldPath}': value does not match required pattern '${pattern}'`,
         pattern,
-        actual_value: error.data
+        actual_value: getInstanceValue(data, error.instancePath)
       }
     }
 
@@ -82,7 +126,7 @@ function formatAjvError(error: ErrorObject): ValidationError {
         field: fieldPath,
         message: `Field '${fieldPath}': must be a valid ${format}`,
         expected: format,
-        actual_value: error.data
+        actual_value: getInstanceValue(data, error.instancePath)
       }
     }
 
@@ -124,10 +168,38 @@ function formatAjvError(error: ErrorObject): ValidationError {
 }
 
 /**
- * Group errors by type
+ * Format Ajv's errors, up to MAX_REPORTED_ERRORS of them. Identical failures (same
+ * keyword, location and params, e.g. reported by several anyOf branches)
+ * would format to identical errors, so each is formatted once.
+ */
+function formatAjvErrors(
+  ajvErrors: ErrorObject[],
+  data: unknown
+): { errors: ValidationError[]; truncated: boolean } {
+  const errors: ValidationError[] = []
+  const seen = new Set<string>()
+
+  for (const error of ajvErrors) {
+    const key = `${error.keyword}|${error.instancePath}|${JSON.stringify(error.params)}`
+    if (seen.has(key)) {
+      continue
+    }
+    if (errors.length === MAX_REPORTED_ERRORS) {
+      return { errors, truncated: true }
+    }
+    seen.add(key)
+    errors.push(formatAjvError(error, data))
+  }
+
+  return { errors, truncated: false }
+}
+
+/**
+ * Group errors by type. Every error type has a group, listed in the order
+ * the result tabs show them, so each error is a single push.
  */
 function groupErrorsByType(errors: ValidationError[]): Record<string, ValidationError[]> {
-  const groups: Record<string, ValidationError[]> = {
+  const groups: Record<ValidationError['type'], ValidationError[]> = {
     required: [],
     format: [],
     pattern: [],
@@ -139,8 +211,7 @@ function groupErrorsByType(errors: ValidationError[]): Record<string, Validation
   }
 
   for (const error of errors) {
-    const type = error.type in groups ? error.type : 'other'
-    groups[type].push(error)
+    groups[error.type].push(error)
   }
 
   return groups
@@ -168,6 +239,52 @@ function consolidateAdditionalPropertyErrors(errors: ValidationError[]): Validat
   return [...otherErrors, consolidatedError]
 }
 
+/**
+ * Result for a validation that couldn't run to completion
+ */
+export function validationErrorResult(error: unknown): ValidationResult {
+  return {
+    valid: false,
+    schema_valid: false,
+    business_rules_valid: false,
+    errors: [{
+      type: 'other',
+      field: '',
+      message: `Validation error: ${error instanceof Error ? error.message : 'Unknown error'}`
+    }],
+    message: 'Validation error'
+  }
+}
+
+/**
+ * Get the compiled validator for an entity, compiling it on first use
+ */
+async function getCompiledValidator(entityName: string): Promise<ValidateFunction> {
+  const fullSchema = await loadEntitySchema(entityName)
+  const cached = validatorCache.get(fullSchema)
+  if (cached) {
+    return cached
+  }
+
+  // A reloaded schema keeps its $id, which Ajv refuses to register twice
+  const schemaId = fullSchema.schema?.$id
+  if (schemaId) {
+    ajv.removeSchema(schemaId)
+  }
+
+  const validate = ajv.compile(fullSchema.schema || fullSchema)
+  validatorCache.set(fullSchema, validate)
+  return validate
+}
+
+/**
+ * Compile the validator for an entity ahead of time so the first
+ * validation doesn't pay for schema loading and code generation
+ */
+export async function precompileEntityValidator(entityName: string): Promise<void> {
+  await getCompiledValidator(entityName)
+}
+
 /**
  * Validate entity data against its schema
  */
@@ -176,27 +293,16 @@ export async function validateEntity(
   data: Record<string, unknown>
 ): Promise<ValidationResult> {
   try {
-    // Load the schema
-    const fullSchema = await loadEntitySchema(entityName)
-    const schema = fullSchema.schema || fullSchema
-
-    // Compile and validate
-    const validate = ajv.compile(schema)
+    // Compile once per entity and reuse across validations
+    const validate = await getCompiledValidator(entityName)
     const valid = validate(data)
 
     if (valid) {
-      return {
-        valid: true,
-        schema_valid: true,
-        business_rules_valid: true,
-        errors: [],
-        errors_by_type: {},
-        message: 'Validation successful'
-      }
+      return VALID_RESULT
     }
 
     // Format errors and consolidate additionalProperty errors
-    const rawErrors = (validate.errors || []).map(formatAjvError)
+    const { errors: rawErrors, truncated } = formatAjvErrors(validate.errors || [], data)
     const errors = consolidateAdditionalPropertyErrors(rawErrors)
     const errors_by_type = groupErrorsByType(errors)
 
@@ -206,19 +312,10 @@ export async function validateEntity(
       business_rules_valid: false,
       errors,
       errors_by_type,
-      message: 'Schema validation failed'
+      message: 'Schema validation failed',
+      truncated
     }
   } catch (error) {
-    return {
-      valid: false,
-      schema_valid: false,
-      business_rules_valid: false,
-      errors: [{
-        type: 'other',
-        field: '',
-        message: `Validation error: ${error instanceof Error ? error.message : 'Unknown error'}`
-      }],
-      message: 'Validation error'
-    }
+    return validationErrorResult(error)
   }
 }
@@ -0,0 +1,31 @@
+/**
+ * Validation worker
+ * Runs schema validation off the main thread so large documents don't
+ * freeze the page. Each validate message is answered with its result;
+ * precompile messages only warm the validator cache.
+ */
+import { validateEntity, precompileEntityValidator } from './validator'
+import type { ValidationRequest, ValidationResponse } from './workerValidator'
+
+// Typed as a Worker since the app's tsconfig only includes the DOM lib
+const worker = self as unknown as Worker
+
+worker.onmessage = async (event: MessageEvent<ValidationRequest>) => {
+  const request = event.data
+
+  if (request.type === 'precompile') {
+    // A failure here shows up again when the entity is validated
+    precompileEntityValidator(request.entityName).catch(() => {})
+    return
+  }
+
+  const result = await validateEntity(request.entityName, request.data)
+  const response: ValidationResponse = { id: request.id, result }
+  worker.postMessage(response)
+}
+
+// A request that can't be read can't be answered, so fail loudly: the
+// error reaches the page's onerror handler, which recycles this worker
+worker.onmessageerror = () => {
+  throw new Error('Could not read validation request')
+}
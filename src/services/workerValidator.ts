@@ -0,0 +1,121 @@
+import { ValidationResult } from '../types'
+import { validateEntity, precompileEntityValidator, validationErrorResult } from './validator'
+
+// Documents shorter than this (in characters of JSON) validate inline.
+// Copying them to the worker and back costs more than it saves.
+const INLINE_MAX_LENGTH = 64 * 1024
+
+// How long a worker validation may take before the worker is given up on
+const WORKER_TIMEOUT_MS = 30000
+
+export type ValidationRequest =
+  | { type: 'precompile'; entityName: string }
+  | { type: 'validate'; id: number; entityName: string; data: Record<string, unknown> }
+
+export interface ValidationResponse {
+  id: number
+  result: ValidationResult
+}
+
+interface PendingValidation {
+  resolve: (result: ValidationResult) => void
+  timeout: ReturnType<typeof setTimeout>
+}
+
+let worker: Worker | null = null
+let lastRequestId = 0
+const pendingValidations = new Map<number, PendingValidation>()
+
+/**
+ * Fail everything in flight and drop the worker; the next validation
+ * starts a new one. Failures resolve to an error result, as they do
+ * when validating inline.
+ */
+function recycleWorker(error: Error): void {
+  for (const pending of pendingValidations.values()) {
+    clearTimeout(pending.timeout)
+    pending.resolve(validationErrorResult(error))
+  }
+  pendingValidations.clear()
+  worker?.terminate()
+  worker = null
+}
+
+/**
+ * Get the validation worker, starting it on first use
+ */
+function getWorker(): Worker {
+  if (worker) {
+    return worker
+  }
+
+  worker = new Worker(new URL('./validator.worker.ts', import.meta.url), { type: 'module' })
+
+  worker.onmessage = (event: MessageEvent<ValidationResponse>) => {
+    const { id, result } = event.data
+    const pending = pendingValidations.get(id)
+    if (pending) {
+      clearTimeout(pending.timeout)
+      pendingValidations.delete(id)
+      pending.resolve(result)
+    }
+  }
+
+  // The worker failed to load, crashed, or couldn't read a request
+  worker.onerror = (event: ErrorEvent) => {
+    recycleWorker(new Error(`Validation worker failed: ${event.message}`))
+  }
+
+  // A response that can't be read can't be matched to its request
+  worker.onmessageerror = () => {
+    recycleWorker(new Error('Validation worker sent an unreadable response'))
+  }
+
+  return worker
+}
+
+/**
+ * Compile an entity's validator ahead of time so its first validation
+ * doesn't pay for schema loading and code generation. Most documents
+ * never reach the worker, so it is only warmed once a large document
+ * has started it.
+ */
+export async function precompileEntityValidators(entityName: string): Promise<void> {
+  if (worker) {
+    const request: ValidationRequest = { type: 'precompile', entityName }
+    worker.postMessage(request)
+  }
+  await precompileEntityValidator(entityName)
+}
+
+/**
+ * Validate entity data, in the validation worker for large documents
+ * and inline for small ones
+ */
+export async function validateEntityData(
+  entityName: string,
+  data: Record<string, unknown>,
+  jsonLength: number
+): Promise<ValidationResult> {
+  if (jsonLength < INLINE_MAX_LENGTH || typeof Worker === 'undefined') {
+    return validateEntity(entityName, data)
+  }
+
+  const id = ++lastRequestId
+  const request: ValidationRequest = { type: 'validate', id, entityName, data }
+  return new Promise(resolve => {
+    const timeout = setTimeout(() => {
+      recycleWorker(new Error(`Validation timed out after ${WORKER_TIMEOUT_MS / 1000}s`))
+    }, WORKER_TIMEOUT_MS)
+    pendingValidations.set(id, { resolve, timeout })
+
+    try {
+      getWorker().postMessage(request)
+    } catch (error) {
+      // The data couldn't be copied to the worker
+      clearTimeout(timeout)
+      pendingValidations.delete(id)
+      resolve(validationErrorResult(error))
+    }
+  })
+}
@@ -18,6 +18,8 @@ export interface ValidationResult {
   errors: ValidationError[]
   errors_by_type?: Record<string, ValidationError[]>
   message: string
+  // Set when there were more errors than the validator reports
+  truncated?: boolean
 }
 
 // Schema types
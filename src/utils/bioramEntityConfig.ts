@@ -7,6 +7,7 @@
  * - LCFS: CARB fields are mostly a subset of BOOST
  * - BioRAM: Reality has fields BOOST doesn't have, and BOOST has fields reality doesn't use
  */
+import { indexByLowerCaseKey, snakeToTitleCase } from './entityNames'
 
 export interface BioramEntityConfig {
   title: string
@@ -116,10 +117,8 @@ export const bioramEntityConfigs: Record<string, BioramEntityConfig> = {
  * Handles: bioram_pathway -> BioramPathway, etc.
  */
 export function normalizeBioramEntityName(name: string): string {
-  const normalized = name
-    .split('_')
-    .map(part => part.charAt(0).toUpperCase() + part.slice(1).toLowerCase())
-    .join('')
+  // Remove underscores and convert to title case
+  const normalized = snakeToTitleCase(name)
 
   // Special handling for Bioram prefix
   if (normalized.toLowerCase().startsWith('bioram')) {
@@ -130,6 +129,8 @@ export function normalizeBioramEntityName(name: string): string {
   return normalized
 }
 
+const bioramConfigsByLowerKey = indexByLowerCaseKey(bioramEntityConfigs)
+
 /**
  * Find matching config for entity name (case-insensitive)
  */
@@ -146,14 +147,7 @@ export function findBioramEntityConfig(entityName: string): BioramEntityConfig |
   }
 
   // Try case-insensitive match
-  const lowerName = entityName.toLowerCase()
-  for (const [key, config] of Object.entries(bioramEntityConfigs)) {
-    if (key.toLowerCase() === lowerName) {
-      return config
-    }
-  }
-
-  return null
+  return bioramConfigsByLowerKey.get(entityName.toLowerCase()) || null
 }
 
 /**
@@ -0,0 +1,24 @@
+/**
+ * Entity Name Utilities
+ * Helpers for matching entity names against config keys
+ */
+
+// Matches the run of underscores before each word (or the start of the
+// name) and captures the word's first character
+const SNAKE_WORD_RE = /(?:^|_)+([^_]?)/g
+
+/**
+ * Convert a snake_case name to title case with the underscores removed
+ * (lcfs_pathway -> LcfsPathway)
+ */
+export function snakeToTitleCase(name: string): string {
+  return name.toLowerCase().replace(SNAKE_WORD_RE, (_match, initial) => initial.toUpperCase())
+}
+
+/**
+ * Index a record by lowercased key, so case-insensitive lookups are a
+ * single map hit instead of a scan over every key
+ */
+export function indexByLowerCaseKey<T>(record: Record<string, T>): Map<string, T> {
+  return new Map(Object.entries(record).map(([key, value]) => [key.toLowerCase(), value]))
+}
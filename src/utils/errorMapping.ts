@@ -4,6 +4,22 @@
  */
 import { ValidationError } from '../types'
 
+// Most errors reported for one validation. A badly wrong document can
+// produce thousands, more than anyone reads and slow to format and render.
+export const MAX_REPORTED_ERRORS = 200
+
+/**
+ * Format an error count for display, e.g. "3 Errors", or "200+ Errors" when
+ * the result was truncated. Without a noun, just the count.
+ */
+export function formatErrorCount(count: number, truncated?: boolean, noun?: string): string {
+  const amount = truncated ? `${count}+` : `${count}`
+  if (!noun) {
+    return amount
+  }
+  return `${amount} ${noun}${count !== 1 || truncated ? 's' : ''}`
+}
+
 /**
  * Extract field name from validation error (handles both string and object formats)
  */
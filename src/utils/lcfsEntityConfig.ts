@@ -2,6 +2,7 @@
  * LCFS Entity Configuration
  * Shared configuration for LCFS entities used by DataGapAnalysis and ValidationResults
  */
+import { indexByLowerCaseKey, snakeToTitleCase } from './entityNames'
 
 export interface EntityConfig {
   title: string
@@ -86,10 +87,7 @@ export const lcfsEntityConfigs: Record<string, EntityConfig> = {
  */
 export function normalizeEntityName(name: string): string {
   // Remove underscores and convert to title case
-  const normalized = name
-    .split('_')
-    .map(part => part.charAt(0).toUpperCase() + part.slice(1).toLowerCase())
-    .join('')
+  const normalized = snakeToTitleCase(name)
 
   // Special handling for LCFS prefix (should be all caps)
   if (normalized.toLowerCase().startsWith('lcfs')) {
@@ -101,6 +99,8 @@ export function normalizeEntityName(name: string): string {
   return normalized
 }
 
+const lcfsConfigsByLowerKey = indexByLowerCaseKey(lcfsEntityConfigs)
+
 /**
  * Find matching config for entity name (case-insensitive)
  */
@@ -117,14 +117,7 @@ export function findLcfsEntityConfig(entityName: string): EntityConfig | null {
   }
 
   // Try case-insensitive match
-  const lowerName = entityName.toLowerCase()
-  for (const [key, config] of Object.entries(lcfsEntityConfigs)) {
-    if (key.toLowerCase() === lowerName) {
-      return config
-    }
-  }
-
-  return null
+  return lcfsConfigsByLowerKey.get(entityName.toLowerCase()) || null
 }
 
 /**